@@ -0,0 +1,70 @@
+"""replace pending verification scheduler job with expires_at
+
+Revision ID: 3f9c2d7a1b84
+Revises: ed544a07e347
+Create Date: 2026-10-17 10:12:41.318204
+
+"""
+from datetime import datetime, timedelta
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9c2d7a1b84'
+down_revision: Union[str, Sequence[str], None] = 'ed544a07e347'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+VERIFICATION_TIMEOUT = timedelta(minutes=5)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('pending_verifications', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('expires_at', sa.DateTime(), nullable=True))
+
+    # --- 数据迁移：沿用调度器中对应移出任务的执行时间，缺失时重新给予完整的验证时间 ---
+    conn = op.get_bind()
+    pending_verifications = sa.table('pending_verifications',
+        sa.column('id', sa.BigInteger),
+        sa.column('expires_at', sa.DateTime),
+    )
+    has_jobstore = sa.inspect(conn).has_table('apscheduler_jobs')
+
+    run_times: dict[str, float] = {}
+    if has_jobstore:
+        jobs = conn.execute(
+            sa.text("SELECT id, next_run_time FROM apscheduler_jobs WHERE id LIKE 'kick\\_%' ESCAPE '\\'")
+        ).fetchall()
+        run_times = {job_id: next_run_time for job_id, next_run_time in jobs if next_run_time}
+
+    default_expires_at = datetime.now() + VERIFICATION_TIMEOUT
+    rows = conn.execute(sa.text("SELECT id, scheduler_job_id FROM pending_verifications")).fetchall()
+    for user_id, job_id in rows:
+        next_run_time = run_times.get(job_id)
+        expires_at = datetime.fromtimestamp(next_run_time) if next_run_time else default_expires_at
+        op.execute(
+            pending_verifications.update()
+            .where(pending_verifications.c.id == user_id)
+            .values(expires_at=expires_at)
+        )
+
+    # 旧任务仍指向 kick_unverified_user，不删除会与过期循环重复移出用户
+    if has_jobstore:
+        conn.execute(sa.text("DELETE FROM apscheduler_jobs WHERE id LIKE 'kick\\_%' ESCAPE '\\'"))
+
+    with op.batch_alter_table('pending_verifications', schema=None) as batch_op:
+        batch_op.alter_column('expires_at', existing_type=sa.DateTime(), nullable=False)
+        batch_op.create_index(batch_op.f('ix_pending_verifications_expires_at'), ['expires_at'], unique=False)
+        batch_op.drop_column('scheduler_job_id')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('pending_verifications', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('scheduler_job_id', sa.String(length=255), server_default='', nullable=False))
+        batch_op.drop_index(batch_op.f('ix_pending_verifications_expires_at'))
+        batch_op.drop_column('expires_at')
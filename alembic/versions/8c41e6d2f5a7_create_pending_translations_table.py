@@ -0,0 +1,78 @@
+"""create pending_translations table
+
+Revision ID: 8c41e6d2f5a7
+Revises: 3f9c2d7a1b84
+Create Date: 2026-10-17 15:42:08.517390
+
+"""
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c41e6d2f5a7'
+down_revision: Union[str, Sequence[str], None] = '3f9c2d7a1b84'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LEGACY_JOB_PREFIX = 'translate_media_item_'
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('pending_translations',
+    sa.Column('server_id', sa.Integer(), nullable=False),
+    sa.Column('item_id', sa.String(length=64), nullable=False),
+    sa.Column('run_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['server_id'], ['server_instances.id'], name=op.f('fk_pending_translations_server_id_server_instances'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('server_id', 'item_id', name=op.f('pk_pending_translations'))
+    )
+    with op.batch_alter_table('pending_translations', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_pending_translations_run_at'), ['run_at'], unique=False)
+
+    # --- 数据迁移：将调度器中逐项的翻译任务迁移到新表 ---
+    conn = op.get_bind()
+    if not sa.inspect(conn).has_table('apscheduler_jobs'):
+        return
+
+    rows = conn.execute(
+        sa.text("SELECT id, next_run_time FROM apscheduler_jobs WHERE id LIKE :prefix"),
+        {'prefix': f'{LEGACY_JOB_PREFIX}%'}
+    ).fetchall()
+
+    pending_translations = sa.table('pending_translations',
+        sa.column('server_id', sa.Integer),
+        sa.column('item_id', sa.String),
+        sa.column('run_at', sa.DateTime),
+    )
+    server_ids = {row[0] for row in conn.execute(sa.text("SELECT id FROM server_instances")).fetchall()}
+
+    for job_id, next_run_time in rows:
+        # 任务 ID 格式为 translate_media_item_{server_id}_{item_id}
+        server_id, _, item_id = job_id.removeprefix(LEGACY_JOB_PREFIX).partition('_')
+        if not server_id.isdigit() or int(server_id) not in server_ids or not item_id:
+            continue
+        run_at = datetime.fromtimestamp(next_run_time) if next_run_time else datetime.now()
+        op.execute(
+            pending_translations.insert().values(
+                server_id=int(server_id),
+                item_id=item_id,
+                run_at=run_at,
+            )
+        )
+
+    conn.execute(
+        sa.text("DELETE FROM apscheduler_jobs WHERE id LIKE :prefix"),
+        {'prefix': f'{LEGACY_JOB_PREFIX}%'}
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('pending_translations', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_pending_translations_run_at'))
+
+    op.drop_table('pending_translations')
@@ -2,8 +2,8 @@ import httpx
 from loguru import logger
 
 from clients.tmdb_client import TmdbClient
-from models.tmdb import TmdbFindPayload, TmdbMovie, TmdbSeason, TmdbTvSeries
-from services.cache_service import CacheService
+from models.tmdb import TmdbEpisode, TmdbFindPayload, TmdbMovie, TmdbSeason, TmdbTvSeries
+from services.cache_service import CacheService, MemoryCache
 
 
 class CachedTmdbClient(TmdbClient):
@@ -12,6 +12,8 @@ class CachedTmdbClient(TmdbClient):
     def __init__(self, client: httpx.AsyncClient, api_key: str, cache_ttl: int = 86400 * 7):
         super().__init__(client, api_key)
         self.cache_ttl = cache_ttl  # 默认缓存 7 天
+        # 剧集/季详情在同一批单集处理中被反复请求，进程内缓存并合并并发请求
+        self._memory = MemoryCache(maxsize=1024, ttl=3600)
 
     async def find_info_by_external_id(
         self,
@@ -34,7 +36,9 @@ class CachedTmdbClient(TmdbClient):
 
     async def get_tv_series_details(self, tmdb_id: int) -> TmdbTvSeries | None:
         key = f"tmdb:tv:{tmdb_id}"
+        return await self._memory.get_or_fetch(key, lambda: self._get_tv_series_details(key, tmdb_id))
 
+    async def _get_tv_series_details(self, key: str, tmdb_id: int) -> TmdbTvSeries | None:
         cached = await CacheService.get(key, TmdbTvSeries)
         if isinstance(cached, TmdbTvSeries):
             logger.debug("缓存命中：{}", key)
@@ -49,7 +53,9 @@ class CachedTmdbClient(TmdbClient):
 
     async def get_tv_seasons_details(self, tmdb_id: int, season_number: int) -> TmdbSeason | None:
         key = f"tmdb:tv:{tmdb_id}:season:{season_number}"
+        return await self._memory.get_or_fetch(key, lambda: self._get_tv_seasons_details(key, tmdb_id, season_number))
 
+    async def _get_tv_seasons_details(self, key: str, tmdb_id: int, season_number: int) -> TmdbSeason | None:
         cached = await CacheService.get(key, TmdbSeason)
         if isinstance(cached, TmdbSeason):
             logger.debug("缓存命中：{}", key)
@@ -62,6 +68,22 @@ class CachedTmdbClient(TmdbClient):
 
         return result
 
+    async def get_tv_season_air_date_index(self, tmdb_id: int, season_number: int) -> dict[str, TmdbEpisode] | None:
+        # 索引由季详情派生，只在进程内缓存，同一季的多集共享一次构建
+        key = f"tmdb:tv:{tmdb_id}:season:{season_number}:air_dates"
+        return await self._memory.get_or_fetch(
+            key, lambda: super(CachedTmdbClient, self).get_tv_season_air_date_index(tmdb_id, season_number)
+        )
+
+    async def get_tv_season_air_date_index_or_latest(
+        self, tmdb_id: int, season_number: int
+    ) -> dict[str, TmdbEpisode] | None:
+        # 季不存在时的回退结果同样缓存，同一季的后续单集不再重复请求失败的季和剧集详情
+        key = f"tmdb:tv:{tmdb_id}:season:{season_number}:air_dates_or_latest"
+        return await self._memory.get_or_fetch(
+            key, lambda: super(CachedTmdbClient, self).get_tv_season_air_date_index_or_latest(tmdb_id, season_number)
+        )
+
     async def get_movie_details(self, tmdb_id: int) -> TmdbMovie | None:
         key = f"tmdb:movie:{tmdb_id}"
 
@@ -4,7 +4,7 @@ import httpx
 from loguru import logger
 
 from clients.base_client import AuthenticatedClient, RateLimiter
-from models.tmdb import TmdbFindPayload, TmdbMovie, TmdbSeason, TmdbTvSeries
+from models.tmdb import TmdbEpisode, TmdbFindPayload, TmdbMovie, TmdbSeason, TmdbTvSeries
 
 
 class TmdbClient(AuthenticatedClient):
@@ -94,6 +94,47 @@ class TmdbClient(AuthenticatedClient):
         params = {"language": "zh-CN"}
         return await self.get(url, params=params, response_model=TmdbSeason)
 
+    async def get_tv_season_air_date_index(self, tmdb_id: int, season_number: int) -> dict[str, TmdbEpisode] | None:
+        """获取季内首播日期到单集的索引，用于按日期匹配单集。
+        Args:
+            tmdb_id (int): TMDB 电视剧 ID。
+            season_number (int): 季节号。
+        Returns:
+            dict[str, TmdbEpisode] | None: 首播日期（YYYY-MM-DD）到单集的映射，季不存在时返回 None。
+                同一天播出多集时保留第一集。
+        """
+        season = await self.get_tv_seasons_details(tmdb_id, season_number)
+        if season is None:
+            return None
+        index: dict[str, TmdbEpisode] = {}
+        for ep in season.episodes:
+            if ep.air_date:
+                index.setdefault(ep.air_date, ep)
+        return index
+
+    async def get_tv_season_air_date_index_or_latest(
+        self, tmdb_id: int, season_number: int
+    ) -> dict[str, TmdbEpisode] | None:
+        """获取季内首播日期索引，季不存在时回退到最新一季。
+        Args:
+            tmdb_id (int): TMDB 电视剧 ID。
+            season_number (int): 季节号。
+        Returns:
+            dict[str, TmdbEpisode] | None: 首播日期到单集的映射，回退后仍获取失败时返回 None。
+        """
+        index = await self.get_tv_season_air_date_index(tmdb_id, season_number)
+        if index is not None:
+            return index
+
+        series = await self.get_tv_series_details(tmdb_id)
+        if not series or not series.seasons:
+            return None
+        last_season_number = series.seasons[-1].season_number
+        if last_season_number == season_number:
+            return None
+        logger.warning(f"获取 TMDB S{season_number} 失败，使用最新季 S{last_season_number} 进行匹配")
+        return await self.get_tv_season_air_date_index(tmdb_id, last_season_number)
+
     async def get_movie_details(self, tmdb_id: int) -> TmdbMovie | None:
         """根据 TMDB ID 获取 TMDB 电影详情。
         Args:
@@ -87,6 +87,7 @@ class Settings(BaseSettings):
     ai_rpd: int | None = None
     ai_tpm: int | None = None
     ai_concurrency: int = 1
+    nfo_rebuild_skip_days: int = 0
     qbittorrent_base_url: str = ''
     qbittorrent_username: str = ''
     qbittorrent_password: str = ''
@@ -28,10 +28,18 @@ from models.orm import ServerType
 from repositories.config_repo import ConfigRepository
 from repositories.server_repo import ServerRepository
 from services.score_service import MessageTrackingState
+from services.verification_service import verification_expiry_loop
+from workers.context import CONTEXT
 from workers.mkv_worker import mkv_merge_task
+from workers.nfo_writer import nfo_write_task
+from workers.translator_worker import (close_pending_translations,
+                                       item_update_task)
 
 settings = get_settings()
 
+# 元数据 API 在重建任务中会被持续并发调用，保持连接存活以复用 TLS 握手
+METADATA_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=16, keepalive_expiry=75)
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # 设置时区
@@ -85,6 +93,7 @@ async def lifespan(app: FastAPI):
             client=httpx.AsyncClient(
                 base_url='https://api.themoviedb.org/3',
                 timeout=httpx.Timeout(10.0, read=30.0),
+                limits=METADATA_HTTP_LIMITS,
                 proxy=settings.proxy or None
             ),
             api_key=settings.tmdb_api_key
@@ -97,6 +106,7 @@ async def lifespan(app: FastAPI):
             client=httpx.AsyncClient(
                 base_url='https://api4.thetvdb.com/v4',
                 timeout=httpx.Timeout(10.0, read=30.0),
+                limits=METADATA_HTTP_LIMITS,
                 proxy=settings.proxy or None
             ),
             api_key=settings.tvdb_api_key
@@ -109,10 +119,17 @@ async def lifespan(app: FastAPI):
 
     await app.state.telethon_client.connect()
     app.state.telethon_worker = asyncio.create_task(app.state.telethon_client.run_until_disconnected())
+    app.state.verification_worker = asyncio.create_task(verification_expiry_loop())
 
     app.state.sonarr_clients = {} # dict[int, SonarrClient]
     app.state.radarr_clients = {} # dict[int, RadarrClient]
     app.state.media_clients = {} # dict[int, MediaService]
+    app.state.item_update_queue = asyncio.Queue()
+    app.state.item_update_worker = asyncio.create_task(
+        item_update_task(app.state.item_update_queue, app.state.media_clients)
+    )
+    app.state.nfo_write_queue = asyncio.Queue()
+    app.state.nfo_write_worker = asyncio.create_task(nfo_write_task(app.state.nfo_write_queue))
 
     # 初始化管理员用户
     async with async_session() as session:
@@ -190,6 +207,13 @@ async def lifespan(app: FastAPI):
     for job in SCHEDULER_JOBS_REGISTRY:
         app.state.scheduler.add_job(job.func, job.trigger, **job.kwargs)
 
+    # 后台任务通过 CONTEXT 读取依赖，调度器启动前填充完毕
+    CONTEXT.tmdb_client = app.state.tmdb_client
+    CONTEXT.ai_client = app.state.ai_client
+    CONTEXT.media_clients = app.state.media_clients
+    CONTEXT.item_update_queue = app.state.item_update_queue
+    CONTEXT.nfo_write_queue = app.state.nfo_write_queue
+
     app.state.scheduler.start()
 
     yield
@@ -203,10 +227,41 @@ async def lifespan(app: FastAPI):
         except asyncio.CancelledError:
             logger.info("MKV 工作线程已取消")
 
+    app.state.verification_worker.cancel()
+    try:
+        await app.state.verification_worker
+    except asyncio.CancelledError:
+        logger.info("验证过期检查任务已取消")
+
+    # 先关闭调度器并取消运行中的任务，之后不会再有新的回写、NFO 写入或待翻译记录产生
     if app.state.scheduler.running:
         app.state.scheduler.shutdown(wait=True)
         logger.info("任务计划程序已关闭")
 
+    # 关闭媒体服务器客户端前，尽量提交已排队的回写
+    try:
+        await asyncio.wait_for(app.state.item_update_queue.join(), timeout=10)
+    except asyncio.TimeoutError:
+        logger.warning("等待媒体项回写超时，剩余 {} 项未提交", app.state.item_update_queue.qsize())
+    app.state.item_update_worker.cancel()
+    try:
+        await app.state.item_update_worker
+    except asyncio.CancelledError:
+        logger.info("媒体项回写任务已取消")
+
+    try:
+        await asyncio.wait_for(app.state.nfo_write_queue.join(), timeout=10)
+    except asyncio.TimeoutError:
+        logger.warning("等待 NFO 写入超时，剩余 {} 个文件未写入", app.state.nfo_write_queue.qsize())
+    app.state.nfo_write_worker.cancel()
+    try:
+        await app.state.nfo_write_worker
+    except asyncio.CancelledError:
+        logger.info("NFO 写入任务已取消")
+
+    # 写入尚在缓冲中的待翻译媒体项，下次启动后由 translate_sweep 继续处理
+    await close_pending_translations()
+
     if app.state.qb_client:
         await app.state.qb_client.close()
     if app.state.tvdb_client:
@@ -16,6 +16,7 @@ from services.cache_service import CacheService
 from services.media_service import MediaService
 from services.score_service import ScoreService
 from services.user_service import UserService
+from workers.translator_worker import translate_sweep
 
 settings = get_settings()
 
@@ -202,3 +203,8 @@ async def cleanup_api_cache_task() -> None:
 async def auto_backup_db() -> None:
     """自动备份数据库"""
     await backup_database()
+
+@scheduled_job('interval', hours=1, id='translate_sweep', replace_existing=True)
+async def translate_sweep_task() -> None:
+    """执行到期的媒体项翻译任务"""
+    await translate_sweep()
@@ -1,7 +1,7 @@
 from pathlib import Path
 
-from jinja2 import (Environment, FileSystemLoader, TemplateNotFound,
-                    select_autoescape)
+from jinja2 import (Environment, FileSystemBytecodeCache, FileSystemLoader,
+                    Template, TemplateNotFound, select_autoescape)
 from loguru import logger
 
 
@@ -30,6 +30,7 @@ class TemplateManager:
             enable_async=True,
             trim_blocks=True,
             lstrip_blocks=True,
+            bytecode_cache=FileSystemBytecodeCache(pattern='__tellymeta_%s.cache'),
         )
         logger.info("模板引擎初始化完成，目录: {}", template_dir)
 
@@ -43,16 +44,30 @@ class TemplateManager:
             raise RuntimeError("TemplateManager 尚未初始化！")
         return self._env
 
-    async def render(self, template_name: str, context: dict) -> str | None:
-        """通用渲染方法"""
+    def get_template(self, template_name: str) -> Template | None:
+        """获取模板，模板文件修改后由环境自动重新加载；模板不存在时返回 None"""
         try:
-            template = self.env.get_template(template_name)
-            return await template.render_async(context)
+            return self.env.get_template(template_name)
         except TemplateNotFound:
             logger.info("缺少通知模板文件：{}", template_name)
             return None
         except Exception as e:
-            logger.error("渲染模板 {} 失败: {}", template_name, e)
+            logger.error("加载模板 {} 失败: {}", template_name, e)
+            return None
+
+    async def render_template(self, template: Template, context: dict) -> str | None:
+        """渲染已获取的模板"""
+        try:
+            return await template.render_async(context)
+        except Exception as e:
+            logger.error("渲染模板 {} 失败: {}", template.name, e)
+            return None
+
+    async def render(self, template_name: str, context: dict) -> str | None:
+        """通用渲染方法"""
+        template = self.get_template(template_name)
+        if template is None:
             return None
+        return await self.render_template(template, context)
 
 template_manager = TemplateManager()
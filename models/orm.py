@@ -125,8 +125,20 @@ class PendingVerification(Base):
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
     captcha_answer: Mapped[str] = mapped_column(String(16), nullable=True)
-    scheduler_job_id: Mapped[str] = mapped_column(String(255), nullable=False)
     message_id: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    expires_at: Mapped[datetime] = mapped_column(DateTime, index=True, nullable=False)
+
+class PendingTranslation(Base):
+    """待翻译媒体项模型 - 由 translate_sweep 定时任务统一处理"""
+    __tablename__ = 'pending_translations'
+
+    server_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey('server_instances.id', ondelete='CASCADE'),
+        primary_key=True
+    )
+    item_id: Mapped[str] = mapped_column(String(64), primary_key=True)
+    run_at: Mapped[datetime] = mapped_column(DateTime, index=True, nullable=False)
 
 class BotConfiguration(Base):
     """Bot 配置模型"""
@@ -0,0 +1,62 @@
+from datetime import datetime
+
+from sqlalchemy import delete, update
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.orm import PendingTranslation
+
+
+class TranslationRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def upsert_many(self, entries: dict[tuple[int, str], datetime]) -> None:
+        """批量写入待翻译媒体项，已存在的记录更新执行时间"""
+        if not entries:
+            return
+        stmt = insert(PendingTranslation).values([
+            {'server_id': server_id, 'item_id': item_id, 'run_at': run_at}
+            for (server_id, item_id), run_at in entries.items()
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['server_id', 'item_id'],
+            set_={'run_at': stmt.excluded.run_at}
+        )
+        await self.session.execute(stmt)
+        await self.session.commit()
+
+    async def claim_due(self, now: datetime, lease_until: datetime) -> list[tuple[int, str]]:
+        """领取所有已到执行时间的待翻译媒体项，将其执行时间推迟到 lease_until
+
+        处理完成前记录保留在表中，进程中途退出时租约到期后会被再次领取
+        """
+        stmt = (
+            update(PendingTranslation)
+            .where(PendingTranslation.run_at <= now)
+            .values(run_at=lease_until)
+            .returning(PendingTranslation.server_id, PendingTranslation.item_id)
+        )
+        result = await self.session.execute(stmt)
+        claimed = [(server_id, item_id) for server_id, item_id in result.all()]
+        await self.session.commit()
+        return claimed
+
+    async def delete(self, server_id: int, item_id: str) -> bool:
+        """删除待翻译媒体项，返回记录是否存在"""
+        pending = await self.session.get(PendingTranslation, (server_id, item_id))
+        if pending:
+            await self.session.delete(pending)
+            await self.session.commit()
+            return True
+        return False
+
+    async def delete_claimed(self, server_id: int, item_id: str, lease_until: datetime) -> None:
+        """删除已处理完成的媒体项；处理期间被重新登记（执行时间已改变）的记录保留"""
+        stmt = delete(PendingTranslation).where(
+            PendingTranslation.server_id == server_id,
+            PendingTranslation.item_id == item_id,
+            PendingTranslation.run_at == lease_until
+        )
+        await self.session.execute(stmt)
+        await self.session.commit()
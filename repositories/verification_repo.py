@@ -1,4 +1,7 @@
-from sqlalchemy import delete
+from collections.abc import Collection
+from datetime import datetime
+
+from sqlalchemy import delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from models.orm import PendingVerification
@@ -9,12 +12,12 @@ class VerificationRepository:
         self.session = session
 
     async def create(
-        self, user_id: int, job_id: str
+        self, user_id: int, expires_at: datetime
     ) -> PendingVerification:
         """创建一个新的待验证用户记录"""
         challenge = PendingVerification(
             id=user_id,
-            scheduler_job_id=job_id,
+            expires_at=expires_at,
         )
         self.session.add(challenge)
         await self.session.commit()
@@ -25,6 +28,20 @@ class VerificationRepository:
         """获取待验证用户记录"""
         return await self.session.get(PendingVerification, user_id)
 
+    async def get_expired_ids(self, now: datetime) -> list[int]:
+        """获取所有已过期的待验证用户 ID"""
+        stmt = select(PendingVerification.id).where(PendingVerification.expires_at <= now)
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_next_expiry(self, exclude: Collection[int] = ()) -> datetime | None:
+        """获取最早的验证过期时间，可排除指定用户"""
+        stmt = select(func.min(PendingVerification.expires_at))
+        if exclude:
+            stmt = stmt.where(PendingVerification.id.not_in(list(exclude)))
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
     async def delete(self, user_id: int) -> None:
         stmt = delete(PendingVerification).where(PendingVerification.id == user_id)
         await self.session.execute(stmt)
@@ -1,4 +1,8 @@
+import asyncio
 import json
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Coroutine, Hashable
 from datetime import datetime, timedelta
 from typing import Any, TypeVar, overload
 
@@ -12,6 +16,7 @@ from core.database import async_session
 from models.orm import ApiCache
 
 T = TypeVar("T", bound=BaseModel)
+R = TypeVar("R")
 
 class CacheService:
     """缓存服务"""
@@ -127,3 +132,50 @@ class CacheService:
                 await session.commit()
             except SQLAlchemyError as e:
                 logger.error("缓存清理期间发生数据库错误：{}", e)
+
+
+class MemoryCache:
+    """进程内 TTL 缓存
+
+    位于数据库缓存之前，命中时无需访问 SQLite；相同键的并发请求共享同一个进行中的 Task。
+    仅缓存非 None 结果，失败或空结果不缓存，后续调用可重试。
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+
+    async def get_or_fetch(self, key: Hashable, factory: Callable[[], Coroutine[Any, Any, R]]) -> R:
+        """返回缓存值，未命中时调用 factory 获取"""
+        entry = self._data.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                self._data.move_to_end(key)
+                return entry[1]
+            del self._data[key]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._inflight[key] = asyncio.create_task(factory())
+            task.add_done_callback(lambda t: self._store(key, t))
+        # shield: 单个调用方被取消时不影响其他等待同一请求的调用方
+        return await asyncio.shield(task)
+
+    def _store(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        result = task.result()
+        if result is None:
+            return
+        self._data[key] = (time.monotonic() + self.ttl, result)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """清空缓存"""
+        self._data.clear()
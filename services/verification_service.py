@@ -2,10 +2,10 @@ import asyncio
 import contextlib
 import textwrap
 from datetime import datetime, timedelta
+from functools import lru_cache
 from random import randint, sample
+from typing import NoReturn
 
-from apscheduler.jobstores.base import JobLookupError
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from fastapi import FastAPI
 from loguru import logger
 from sqlalchemy.exc import SQLAlchemyError
@@ -21,11 +21,19 @@ from services.user_service import Result, UserService
 
 settings = get_settings()
 KICK_TASK_SEMAPHORE = asyncio.Semaphore(3)  # 限制同时踢人任务的数量
+VERIFICATION_TIMEOUT = timedelta(minutes=5)
+KICK_RETRY_INTERVAL = timedelta(minutes=1)  # 清理记录失败后的重试间隔
+_expiry_wakeup = asyncio.Event()  # 出现更早的过期时间时唤醒过期循环
+_kick_retry_at: dict[int, datetime] = {}  # 清理记录失败的用户及其下次重试时间
+
+@lru_cache(maxsize=4096)
+def _verify_callback_data(option: int) -> bytes:
+    """验证码按钮回调数据，选项范围有限，缓存复用"""
+    return b"verify_" + str(option).encode('ascii')
 
 class VerificationService:
     def __init__(self, app: FastAPI, session: AsyncSession) -> None:
         self.client: TelethonClientWarper = app.state.telethon_client
-        self.scheduler: AsyncIOScheduler = app.state.scheduler
         self.verification_repo = VerificationRepository(session)
 
     async def start_verification(self, user_id: int) -> Result:
@@ -51,20 +59,11 @@ class VerificationService:
             ]
         ]
 
-        kick_time = datetime.now() + timedelta(minutes=5)
-        job = self.scheduler.add_job(
-            kick_unverified_user,
-            'date',
-            run_date=kick_time,
-            args=[user_id],
-            id=f"kick_{user_id}",
-            replace_existing=True
-        )
-
         await self.verification_repo.create(
             user_id=user_id,
-            job_id=job.id
+            expires_at=datetime.now() + VERIFICATION_TIMEOUT
         )
+        _expiry_wakeup.set()
 
         await self.client.ban_user(user_id, None)  # 先禁言，防止其在验证前发送消息
         return Result(
@@ -90,7 +89,7 @@ class VerificationService:
 
         shuffled_options = sample(list(options), len(options))
 
-        buttons = [Button.inline(str(opt), b"verify_" + str(opt).encode()) for opt in shuffled_options]
+        buttons = [Button.inline(str(opt), _verify_callback_data(opt)) for opt in shuffled_options]
         keyboard = [buttons[i:i + 2] for i in range(0, len(buttons), 2)]
         return image_data, keyboard
 
@@ -104,10 +103,6 @@ class VerificationService:
             await kick_unverified_user( user_id)
             return Result(success=False, message="验证码错误，请重新加入群组重试。")
 
-        # 删除定时任务
-        with contextlib.suppress(JobLookupError):
-            self.scheduler.remove_job(challenge.scheduler_job_id)
-
         # 删除验证记录
         await self.verification_repo.delete(user_id)
         await self.client.unban_user(user_id)  # 解除用户禁言
@@ -121,13 +116,11 @@ class VerificationService:
         if not challenge:
             return Result(success=False, message=f"未[{user_name}](tg://user?id={user_id})找到验证记录，可能已过期。")
         await kick_unverified_user(user_id, is_ban=is_ban)
-        with contextlib.suppress(JobLookupError):
-            self.scheduler.remove_job(challenge.scheduler_job_id)
 
         return Result(success=True, message=f"[{user_name}](tg://user?id={user_id})已被移出群组。")
 
-async def kick_unverified_user(user_id: int, is_ban: bool = False) -> None:
-    """将未通过验证的用户移出群组"""
+async def kick_unverified_user(user_id: int, is_ban: bool = False) -> bool:
+    """将未通过验证的用户移出群组，返回验证记录是否已清理"""
     from main import app
     session_factory: async_sessionmaker[AsyncSession] = async_session
     client: TelethonClientWarper = app.state.telethon_client
@@ -153,5 +146,63 @@ async def kick_unverified_user(user_id: int, is_ban: bool = False) -> None:
             except SQLAlchemyError as e:
                 await session.rollback()
                 logger.error("移出未验证用户 {} 失败: {}", user_id, e)
+                return False
             finally:
                 await session.close()
+    return True
+
+async def verification_expiry_loop() -> NoReturn:
+    """按最早的过期时间休眠，批量移出超时未验证的用户
+
+    清理记录失败的用户按 KICK_RETRY_INTERVAL 退避重试，不会每次循环都重复移出
+    """
+    while True:
+        _expiry_wakeup.clear()
+        next_expiry: datetime | None = None
+        try:
+            now = datetime.now()
+            async with async_session() as session:
+                verification_repo = VerificationRepository(session)
+                expired_ids = await verification_repo.get_expired_ids(now)
+
+            # 记录已被其他途径清理的用户无需再重试
+            for user_id in _kick_retry_at.keys() - set(expired_ids):
+                del _kick_retry_at[user_id]
+            due_ids = [user_id for user_id in expired_ids if _kick_retry_at.get(user_id, now) <= now]
+            if due_ids:
+                logger.info("共有 {} 个用户验证超时，正在移出群组", len(due_ids))
+                results = await asyncio.gather(
+                    *(kick_unverified_user(user_id) for user_id in due_ids),
+                    return_exceptions=True
+                )
+                for user_id, cleaned in zip(due_ids, results):
+                    if isinstance(cleaned, BaseException):
+                        if not isinstance(cleaned, Exception):
+                            raise cleaned
+                        logger.error("移出未验证用户 {} 失败: {}", user_id, cleaned)
+                        cleaned = False
+                    if cleaned:
+                        _kick_retry_at.pop(user_id, None)
+                    else:
+                        _kick_retry_at[user_id] = datetime.now() + KICK_RETRY_INTERVAL
+
+            async with async_session() as session:
+                next_expiry = await VerificationRepository(session).get_next_expiry(exclude=_kick_retry_at.keys())
+            if _kick_retry_at:
+                next_retry = min(_kick_retry_at.values())
+                next_expiry = min(next_expiry, next_retry) if next_expiry else next_retry
+        except SQLAlchemyError as e:
+            logger.error("检查验证过期记录失败: {}", e)
+            next_expiry = datetime.now() + timedelta(seconds=30)
+        except Exception as e:
+            # 单次循环出错不能终止唯一的过期检查任务
+            logger.exception("验证过期检查出错: {}", e)
+            next_expiry = datetime.now() + timedelta(seconds=30)
+
+        timeout = None
+        if next_expiry is not None:
+            # 至少等待 1 秒，避免忙循环
+            timeout = max((next_expiry - datetime.now()).total_seconds(), 1.0)
+
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(_expiry_wakeup.wait(), timeout)
@@ -0,0 +1,21 @@
+import asyncio
+from dataclasses import dataclass, field
+
+from clients.ai_client import AIClientWarper
+from clients.tmdb_client import TmdbClient
+from services.media_service import MediaService
+
+
+@dataclass(slots=True)
+class WorkerContext:
+    """后台任务共享的运行时依赖
+
+    由 lifespan 在启动时填充一次，任务执行时直接读取，无需在每次调用中 `from main import app`
+    """
+    tmdb_client: TmdbClient | None = None
+    ai_client: AIClientWarper | None = None
+    media_clients: dict[int, MediaService] = field(default_factory=dict)
+    item_update_queue: asyncio.Queue | None = None
+    nfo_write_queue: asyncio.Queue | None = None
+
+CONTEXT = WorkerContext()
@@ -1,38 +1,54 @@
 import asyncio
+import io
 import json
 import time
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
 import aiofiles.os as aio_os
 from loguru import logger
 
+MKVMERGE_STREAM_LIMIT = 16 * 1024 * 1024  # mkvmerge -J 输出可能很大，放宽 StreamReader 限制
+_ZH_LANG = frozenset({"chi", "zh"})
+_ZH_IETF = frozenset({"zh-Hans", "zh-Hant"})
+
+
+async def _read_stream(stream: asyncio.StreamReader) -> bytearray:
+    """按 io.DEFAULT_BUFFER_SIZE 分块读取子进程输出，直接追加到同一缓冲区"""
+    buffer = bytearray()
+    while chunk := await stream.read(io.DEFAULT_BUFFER_SIZE):
+        buffer += chunk
+    return buffer
+
 
 async def get_mkv_info(episode_path: Path) -> None | dict[str, list[dict[str, Any]]]:
     """获取 MKV 文件的轨道和附件信息，确保文件存在且大小稳定后再进行处理"""
     start_time = time.time()
-    while not await aio_os.path.exists(episode_path):
-        if time.time() - start_time > 600:  # 超过10分钟仍未找到文件，退出循环
-            logger.error("超时：文件 {} 从未出现。", episode_path)
-            return None
-        logger.info("正在等待 {} 存在...", episode_path)
-        await asyncio.sleep(5)
-
     last_size = -1
     stable_checks = 0
     stable_checks_required = 3  # 连续3次检查文件大小不变才认为文件稳定
+    seen = False
     while stable_checks < stable_checks_required:
-        if time.time() - start_time > 600:  # 超过10分钟仍未找到文件，退出循环
-            logger.error("超时：文件 {} 从未稳定。", episode_path)
+        if time.time() - start_time > 600:  # 超过10分钟仍未找到文件或文件未稳定，退出循环
+            if seen:
+                logger.error("超时：文件 {} 从未稳定。", episode_path)
+            else:
+                logger.error("超时：文件 {} 从未出现。", episode_path)
             return None
 
+        # 单次 stat 同时完成存在性检查与大小获取
         try:
-            current_size = await aio_os.path.getsize(episode_path)
+            current_size = (await aio_os.stat(episode_path)).st_size
         except FileNotFoundError:
-            last_size = -1
-            stable_checks = 0
-            await asyncio.sleep(2)
+            if seen:
+                last_size = -1
+                stable_checks = 0
+                await asyncio.sleep(2)
+            else:
+                logger.info("正在等待 {} 存在...", episode_path)
+                await asyncio.sleep(5)
             continue
+        seen = True
 
         if current_size == last_size and current_size > 0:
             stable_checks += 1
@@ -45,30 +61,36 @@ async def get_mkv_info(episode_path: Path) -> None | dict[str, list[dict[str, An
     process = await asyncio.create_subprocess_exec(
         'mkvmerge', '-J', str(episode_path),
         stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE
+        stderr=asyncio.subprocess.PIPE,
+        limit=MKVMERGE_STREAM_LIMIT
+    )
+    stdout, stderr = await asyncio.gather(
+        _read_stream(cast(asyncio.StreamReader, process.stdout)),
+        cast(asyncio.StreamReader, process.stderr).read()
     )
-    stdout, stderr = await process.communicate()
+    await process.wait()
     if process.returncode != 0:
         logger.error("在 {} 上运行 mkvmerge -J 时出错：{}", episode_path, stderr.decode().strip())
         return None
 
     try:
         loop = asyncio.get_running_loop()
-        mkvinfo_json = await loop.run_in_executor(None, json.loads, stdout.decode())
-        # mkvinfo_json = json.loads(stdout.decode())
-    except json.JSONDecodeError as e:
+        # json.loads 可直接接受字节数据，省去一次 decode 拷贝
+        mkvinfo_json = await loop.run_in_executor(None, json.loads, stdout)
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
         logger.error("无法解码 mkvmerge JSON 输出：{}", e)
         return None
 
-    tracks = [
-        {
+    tracks = []
+    for track in mkvinfo_json.get("tracks", []):
+        properties = track.get("properties", {})
+        tracks.append({
             "id": track.get("id"),
             "type": track.get("type"),
-            "language": track.get("properties", {}).get("language"),
-            "language_ietf": track.get("properties", {}).get("language_ietf"),
-            "name": track.get("properties", {}).get("track_name"),
-        } for track in mkvinfo_json.get("tracks", [])
-    ]
+            "language": properties.get("language"),
+            "language_ietf": properties.get("language_ietf"),
+            "name": properties.get("track_name"),
+        })
     attachments = [
         {
             "id": attachment.get("id"),
@@ -89,23 +111,25 @@ async def mkv_merge(episode_path: Path) -> None:
         return
 
     output_path = episode_path.with_suffix('.merged.mkv')
-    # 处理轨道
-    subtitle_tracks = [track for track in mkv_info["tracks"] if track.get("type") == "subtitles"]
+    # 处理轨道：一次遍历完成字幕分类
+    has_subtitles = False
+    non_chinese_exists = False
+    chinese_subtitle_tracks = []
+    for track in mkv_info["tracks"]:
+        if track.get("type") != "subtitles":
+            continue
+        has_subtitles = True
+        if track.get("language") in _ZH_LANG or track.get("language_ietf") in _ZH_IETF:
+            chinese_subtitle_tracks.append(track)
+        else:
+            non_chinese_exists = True
 
-    if not subtitle_tracks or all(
-        track.get("language") in ["chi", "zh"] or track.get("language_ietf") in ["zh-Hans", "zh-Hant"]
-        for track in subtitle_tracks
-    ):
+    if not has_subtitles or not non_chinese_exists:
         logger.info("{} 中未找到字幕或只有中文字幕，正在跳过合并", episode_path)
         return
 
     cmd = ['mkvmerge', '-o', str(output_path)]
 
-    chinese_subtitle_tracks = [
-        track for track in subtitle_tracks
-        if track.get("language") in ["chi", "zh"] or track.get("language_ietf") in ["zh-Hans", "zh-Hant"]
-    ]
-
     if not chinese_subtitle_tracks:
     # 没有中文字幕轨道，仅保留非字幕轨道，并删除所有附件
         cmd.extend(["--no-subtitles", "--no-attachments", str(episode_path)])
@@ -116,10 +140,10 @@ async def mkv_merge(episode_path: Path) -> None:
 
     process = await asyncio.create_subprocess_exec(
         *cmd,
-        stdout=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.DEVNULL,
         stderr=asyncio.subprocess.PIPE
     )
-    stdout, stderr = await process.communicate()
+    _, stderr = await process.communicate()
     if process.returncode != 0:
         logger.error("在 {} 上运行 mkvmerge 时出错：{}", episode_path, stderr.decode().strip())
         return
@@ -1,63 +1,251 @@
 import asyncio
 import contextlib
-import re
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable
+from dataclasses import asdict, dataclass
+from datetime import timedelta
 from pathlib import Path
+from typing import Any
 
-import aiofiles
-import aiofiles.os as aio_os
+from jinja2 import Template
 from loguru import logger
 
 from clients.radarr_client import RadarrClient
 from clients.sonarr_client import SonarrClient
 from clients.tmdb_client import TmdbClient
 from clients.tvdb_client import TvdbClient
+from core.config import get_settings
 from core.template_manager import template_manager
 from models.radarr import MovieResource, RadarrWebhookAddedPayload, RadarrWebhookDownloadPayload
 from models.sonarr import (EpisodeResource, SeriesResource, SonarrEpisode, SonarrSeries,
                            SonarrWebhookDownloadPayload,
                            SonarrWebhookSeriesAddPayload)
-from models.tmdb import TmdbEpisode
-from models.tvdb import TvdbData, TvdbEpisodesData
+from models.tmdb import TmdbEpisode, TmdbTvSeries
+from models.tvdb import TvdbData, TvdbEpisodesData, TvdbPayload
+from services.cache_service import MemoryCache
+from workers.context import CONTEXT
+from workers.nfo_writer import PendingWrites, flush_nfos, write_nfo
+from workers.utils import EPISODE_TITLE_RE
 
 
 VIDEO_EXTENSIONS = {'.mp4', '.mkv', '.avi', '.mov', '.wmv', '.flv', '.m4v', '.webm', '.ts'}
+EPISODE_CONCURRENCY = 16  # 全局并发获取单集元数据的上限，速率由各客户端的 RateLimiter 控制
+MOVIE_CONCURRENCY = (os.cpu_count() or 4) * 2  # 重建时并发处理的电影数
+SERIES_PREFETCH = 4  # 重建时提前获取单集列表的剧集数
+PROGRESS_LOG_INTERVAL = 10  # 重建时每处理多少部剧集/电影输出一次进度
+EPISODE_POLL_INTERVAL = 5  # 新剧集添加后轮询 Sonarr 集数的间隔（秒）
+EPISODE_POLL_TIMEOUT = 60  # 轮询等待文件导入的最长时间（秒）
 
-@contextlib.asynccontextmanager
-async def _temporary_ignore_file(path: Path):
-    """创建临时 .ignore 文件上下文管理器"""
-    ignore_file = path / '.ignore'
-    created = False
-    if not await aio_os.path.exists(ignore_file):
+METADATA_CACHE_SIZE = 1024  # 进程内缓存的剧集/季详情条目数
+METADATA_CACHE_TTL = 3600  # 进程内缓存有效期（秒）
+RENDER_CACHE_SIZE = 256  # 缓存的 NFO 渲染结果数
+
+settings = get_settings()
+
+EPISODE_SEMAPHORE = asyncio.Semaphore(EPISODE_CONCURRENCY)  # 重建任务与 Webhook 共享
+
+
+@dataclass(slots=True, frozen=True)
+class EpisodeContext:
+    """单集 NFO 模板上下文"""
+    title: str | None
+    plot: str | None
+    season_number: int
+    episode_number: int
+    aired_date: str | None
+    tvdb_id: int | None
+    tmdb_id: int | None
+
+# 重建任务、Webhook 与新剧集补全共享；TMDB 剧集/季详情与季索引由 CachedTmdbClient 自行缓存
+_metadata_cache = MemoryCache(maxsize=METADATA_CACHE_SIZE, ttl=METADATA_CACHE_TTL)
+
+
+async def _cached_series_translations(tvdb: TvdbClient, tvdb_id: int) -> TvdbPayload | None:
+    """获取 TVDB 剧集翻译（进程内缓存）"""
+    return await _metadata_cache.get_or_fetch(
+        ('tvdb_series_translations', tvdb_id), lambda: tvdb.series_translations(tvdb_id)
+    )
+
+def _list_existing_nfos(directories: Iterable[Path]) -> set[Path]:
+    """一次性列出多个目录中已存在的 NFO 文件，替代逐个文件的 exists 探测"""
+    existing: set[Path] = set()
+    for directory in directories:
         try:
-            async with aiofiles.open(ignore_file, 'w', encoding='utf-8') as f:
-                await f.write("# Ignore file created by TellyMeta.\n")
-            created = True
-            logger.debug("已创建忽略文件: {}", ignore_file)
-        except OSError as e:
-            logger.error("创建忽略文件失败: {} - {}", ignore_file, e)
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.name.endswith('.nfo') and entry.is_file():
+                        existing.add(Path(entry.path))
+        except OSError:
+            continue
+    return existing
+
+def _scan_movie_folder(folder_path: Path) -> tuple[list[Path], set[str]]:
+    """扫描电影目录，返回视频文件列表与已存在的 NFO 文件名
+
+    使用 os.scandir，DirEntry 自带文件类型信息，只有符号链接需要额外 stat 解析目标
+    """
+    video_files: list[Path] = []
+    existing_nfos: set[str] = set()
+    with os.scandir(folder_path) as it:
+        for entry in it:
+            if not entry.is_file():
+                continue
+            ext = os.path.splitext(entry.name)[1]
+            if ext == '.nfo':
+                existing_nfos.add(entry.name)
+            elif ext.lower() in VIDEO_EXTENSIONS:
+                video_files.append(Path(entry.path))
+    return video_files, existing_nfos
+
+def _create_ignore_file_sync(ignore_file: Path) -> bool:
+    """以独占模式创建忽略文件，已存在时返回 False
+
+    存在检查与写入合并为一次系统调用，只需一次线程池往返
+    """
+    try:
+        with open(ignore_file, 'x', encoding='utf-8') as f:
+            f.write("# Ignore file created by TellyMeta.\n")
+    except FileExistsError:
+        return False
+    return True
+
+async def _is_fresh(nfo_path: Path, max_age: timedelta) -> bool:
+    """NFO 文件存在且修改时间在 max_age 以内"""
+    try:
+        st = await asyncio.to_thread(os.stat, nfo_path)
+    except OSError:
+        return False
+    return time.time() - st.st_mtime < max_age.total_seconds()
+
+async def _create_ignore_file(ignore_file: Path, removal: asyncio.Task | None) -> bool:
+    """创建忽略文件，返回是否由本次创建；同一目录上一轮的删除未完成时先等待其完成"""
+    if removal is not None:
+        await removal
+    try:
+        created = await asyncio.to_thread(_create_ignore_file_sync, ignore_file)
+    except OSError as e:
+        logger.error("创建忽略文件失败: {} - {}", ignore_file, e)
+        return False
+    if created:
+        logger.debug("已创建忽略文件: {}", ignore_file)
+    return created
+
+async def _remove_ignore_file(ignore_file: Path, creation: asyncio.Task[bool]) -> None:
+    """等待创建完成后删除忽略文件，仅删除由 _create_ignore_file 创建的文件"""
+    if not await creation:
+        return
+    try:
+        await asyncio.to_thread(os.remove, ignore_file)
+        logger.debug("已删除忽略文件: {}", ignore_file)
+    except OSError as e:
+        logger.error("删除忽略文件失败: {} - {}", ignore_file, e)
+
+_ignore_refcounts: dict[Path, int] = {}
+_ignore_creations: dict[Path, asyncio.Task[bool]] = {}
+_ignore_removals: dict[Path, asyncio.Task[None]] = {}
+
+
+@contextlib.asynccontextmanager
+async def _ignore_guard(path: Path):
+    """在目录中放置临时 .ignore 文件
 
+    同一目录的并发或嵌套调用共享同一个文件：第一个进入者发起创建，所有进入者都等待创建完成，
+    最后一个退出者删除。创建与删除在独立的 Task 中执行，调用方被取消时不会中断文件操作
+    """
+    ignore_file = path / '.ignore'
     try:
+        _ignore_refcounts[path] = _ignore_refcounts.get(path, 0) + 1
+        creation = _ignore_creations.get(path)
+        if creation is None:
+            creation = _ignore_creations[path] = asyncio.create_task(
+                _create_ignore_file(ignore_file, _ignore_removals.get(path))
+            )
+        await asyncio.shield(creation)
         yield
     finally:
-        if created:
-            try:
-                await aio_os.remove(ignore_file)
-                logger.debug("已删除忽略文件: {}", ignore_file)
-            except OSError as e:
-                logger.error("删除忽略文件失败: {} - {}", ignore_file, e)
-
-
-async def _generate_and_save_nfo(template_name: str, context: dict, file_path: Path):
-    """通用 NFO 生成与保存逻辑"""
-    nfo_content = await template_manager.render(template_name, context)
+        _ignore_refcounts[path] -= 1
+        if _ignore_refcounts[path] == 0:
+            del _ignore_refcounts[path]
+            removal = _ignore_removals[path] = asyncio.create_task(
+                _remove_ignore_file(ignore_file, _ignore_creations.pop(path))
+            )
+            removal.add_done_callback(
+                lambda t: _ignore_removals.pop(path) if _ignore_removals.get(path) is t else None
+            )
+            await asyncio.shield(removal)
+
+
+_render_cache: OrderedDict[tuple[Template, Hashable], str] = OrderedDict()
+
+
+def _freeze(value: Any) -> Hashable:
+    """将上下文中的列表/字典转换为可哈希的元组"""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+async def _render_nfo(template_name: str, context: dict | EpisodeContext) -> str | None:
+    """渲染 NFO 模板，相同模板与上下文直接复用上次的渲染结果
+
+    EpisodeContext 不可变且可哈希，直接作为缓存键，只在未命中时转换为字典；
+    缓存键包含当前的模板对象，模板文件修改并重新加载后旧的渲染结果不再命中
+    """
+    template = template_manager.get_template(template_name)
+    if template is None:
+        return None
+    if isinstance(context, EpisodeContext):
+        key = (template, context)
+    else:
+        key = (template, _freeze(context))
+    nfo_content = _render_cache.get(key)
+    if nfo_content is not None:
+        _render_cache.move_to_end(key)
+        return nfo_content
+
+    nfo_content = await template_manager.render_template(
+        template, asdict(context) if isinstance(context, EpisodeContext) else context
+    )
+    if nfo_content:
+        _render_cache[key] = nfo_content
+        if len(_render_cache) > RENDER_CACHE_SIZE:
+            _render_cache.popitem(last=False)
+    return nfo_content
+
+
+async def _generate_and_save_nfo(
+    template_name: str,
+    context: dict | EpisodeContext,
+    file_path: Path,
+    pending_writes: PendingWrites | None = None
+):
+    """通用 NFO 生成与保存逻辑
+
+    提供 pending_writes 时只渲染并收集内容，由调用方通过 flush_nfos 统一写入；
+    否则交给 nfo_write_task 批量写入
+    """
+    nfo_content = await _render_nfo(template_name, context)
     if not nfo_content:
         logger.error("{} 模板渲染返回空，跳过文件创建", template_name)
         return
 
+    if pending_writes is not None:
+        pending_writes.append((file_path, nfo_content))
+        return
+
+    if CONTEXT.nfo_write_queue is not None:
+        await CONTEXT.nfo_write_queue.put((file_path, nfo_content))
+        return
+
     try:
-        async with aiofiles.open(file_path, 'w', encoding='utf-8') as nfo_file:
-            await nfo_file.write(nfo_content)
-        logger.info("已创建 NFO 文件: {}", file_path)
+        # 单次线程调用完成 open/write/close，避免 aiofiles 的多次线程池往返
+        if await asyncio.to_thread(write_nfo, file_path, nfo_content):
+            logger.info("已创建 NFO 文件: {}", file_path)
+        else:
+            logger.debug("NFO 文件内容未变化，跳过写入: {}", file_path)
     except OSError as e:
         logger.error("写入 NFO 文件失败 (IO错误): {} - {}", file_path, e)
 
@@ -67,52 +255,62 @@ async def _get_episode_context(
     tvdb: TvdbClient | None,
     series_tmdb_id: int,
     ep_obj: EpisodeResource | SonarrEpisode,
-) -> dict:
+) -> EpisodeContext:
     """获取单集 NFO 上下文数据"""
     tvdb_id = ep_obj.tvdbId
     season_num = ep_obj.seasonNumber
     ep_num = ep_obj.episodeNumber
     air_date = str(ep_obj.airDate) if ep_obj.airDate else None
 
-    # TVDB
+    # TVDB 翻译与 TMDB 查询互不依赖，并发请求
+    tmdb_task = asyncio.create_task(tmdb.find_info_by_external_id('tvdb_id', str(tvdb_id)))
+
     tvdb_data: TvdbData | None = None
-    tvdb_ext_data: TvdbEpisodesData | None = None
-
-    if tvdb:
-        trans_payload = await tvdb.episodes_translations(tvdb_id)
-        if trans_payload and isinstance(trans_payload.data, TvdbData):
-            tvdb_data = trans_payload.data
-        if not tvdb_data:
-            with contextlib.suppress(Exception):
-                tvdb_ext_data = await tvdb.episodes_extended(tvdb_id)
+    try:
+        if tvdb:
+            try:
+                trans_payload = await tvdb.episodes_translations(tvdb_id)
+            except Exception as e:
+                logger.warning("获取 TVDB 单集翻译失败: {} - {}", tvdb_id, e)
+                trans_payload = None
+            if trans_payload and isinstance(trans_payload.data, TvdbData):
+                tvdb_data = trans_payload.data
+
+        # TVDB 已提供完整的标题与简介时，TMDB 查询结果只用于单集 ID 与播出日期，无需按日期回退匹配
+        tvdb_complete = bool(tvdb_data and tvdb_data.name and tvdb_data.overview)
+
+        try:
+            tmdb_find = await tmdb_task
+        except Exception as e:
+            logger.warning("通过 TVDB ID 查询 TMDB 单集失败: {} - {}", tvdb_id, e)
+            tmdb_find = None
+    finally:
+        # 调用方在等待 TVDB 期间被取消时，不留下无人等待的 TMDB 请求
+        if not tmdb_task.cancel() and not tmdb_task.cancelled():
+            tmdb_task.exception()
 
     # TMDB
     tmdb_ep: TmdbEpisode | None = None
-    tmdb_find = await tmdb.find_info_by_external_id('tvdb_id', str(tvdb_id))
     if tmdb_find and tmdb_find.tv_episode_results:
         tmdb_ep = tmdb_find.tv_episode_results[0]
 
-    if not tmdb_ep and series_tmdb_id > 0:
+    if not tmdb_ep and series_tmdb_id > 0 and not tvdb_complete:
+        # 仅在需要按播出日期匹配时才请求 TVDB 扩展信息
+        tvdb_ext_data: TvdbEpisodesData | None = None
+        if tvdb and not tvdb_data:
+            try:
+                tvdb_ext_data = await tvdb.episodes_extended(tvdb_id)
+            except Exception as e:
+                logger.warning("获取 TVDB 单集扩展信息失败: {} - {}", tvdb_id, e)
         target_air_date = (tvdb_ext_data.aired if tvdb_ext_data else None) or air_date
 
         if target_air_date:
-            tmdb_season = await tmdb.get_tv_seasons_details(series_tmdb_id, season_num)
-            if not tmdb_season:
-                series_info = await tmdb.get_tv_series_details(series_tmdb_id)
-                if series_info and series_info.seasons:
-                    tmdb_season = await tmdb.get_tv_seasons_details(
-                        series_tmdb_id,
-                        series_info.seasons[-1].season_number
-                    )
-
-            if tmdb_season and tmdb_season.episodes:
-                for ep in tmdb_season.episodes:
-                    if ep.air_date == target_air_date:
-                        tmdb_ep = ep
-                        break
+            season_index = await tmdb.get_tv_season_air_date_index_or_latest(series_tmdb_id, season_num)
+            if season_index:
+                tmdb_ep = season_index.get(target_air_date)
 
     tmdb_title = None
-    if tmdb_ep and tmdb_ep.name and not re.match(r'^(第[\d ]+集|Episode\s*[\d ]+)$', tmdb_ep.name, re.IGNORECASE):
+    if tmdb_ep and tmdb_ep.name and not EPISODE_TITLE_RE.match(tmdb_ep.name):
         tmdb_title = tmdb_ep.name
 
     title = (
@@ -125,76 +323,151 @@ async def _get_episode_context(
         (tmdb_ep.overview if tmdb_ep else None)
     )
 
+    return EpisodeContext(
+        title=title,
+        plot=plot,
+        season_number=season_num,
+        episode_number=ep_num,
+        aired_date=(tmdb_ep.air_date if tmdb_ep else None) or air_date,
+        tvdb_id=tvdb_id,
+        tmdb_id=tmdb_ep.id if tmdb_ep else None
+    )
+
+
+def _build_series_context(
+    series: SeriesResource | SonarrSeries,
+    tvdb_payload: TvdbPayload | None,
+    tmdb_payload: TmdbTvSeries | None
+) -> dict:
+    """合并 TVDB 翻译、TMDB 详情与 Sonarr 资源，生成剧集 NFO 上下文
+
+    优先使用 TVDB 中文翻译，其次 TMDB，最后回退到 Sonarr 自带信息
+    """
+    tvdb_data = tvdb_payload.data if tvdb_payload and isinstance(tvdb_payload.data, TvdbData) else None
+    if tmdb_payload:
+        fallback_title = tmdb_payload.name
+        fallback_plot = tmdb_payload.overview
+        original_title = tmdb_payload.original_name
+        premiered = tmdb_payload.first_air_date
+        genres = tmdb_payload.genres or series.genres
+    else:
+        fallback_title = series.title
+        fallback_plot = series.overview
+        original_title = premiered = None
+        genres = series.genres
+
     return {
-        "title": title,
-        "plot": plot,
-        "season_number": season_num,
-        "episode_number": ep_num,
-        "aired_date": (tmdb_ep.air_date if tmdb_ep else None) or air_date,
-        "tvdb_id": tvdb_id,
-        "tmdb_id": tmdb_ep.id if tmdb_ep else None
+        "title": (tvdb_data.name if tvdb_data else None) or fallback_title,
+        "original_title": original_title,
+        "plot": (tvdb_data.overview if tvdb_data else None) or fallback_plot,
+        # 有序去重，保证 NFO 输出稳定
+        "genres": list(dict.fromkeys(genres)),
+        "premiered": premiered,
+        "imdb_id": series.imdbId,
+        "tvdb_id": series.tvdbId,
+        "tmdb_id": series.tmdbId,
     }
 
-
 async def create_series_nfo_from_resource(
     series: SeriesResource | SonarrSeries,
     tmdb: TmdbClient,
     tvdb: TvdbClient | None = None,
-    is_override: bool = True
+    is_override: bool = True,
+    pending_writes: PendingWrites | None = None,
+    skip_if_fresh: timedelta | None = None
 ) -> None:
-    """从剧集资源对象创建 NFO"""
+    """从剧集资源对象创建 NFO
+
+    skip_if_fresh 不为空时，NFO 在该时间内生成过则跳过所有网络请求
+    """
     if not series.path:
         return
 
     nfo_path = Path(series.path) / 'tvshow.nfo'
-    if await aio_os.path.exists(nfo_path) and not is_override:
+    if not is_override and await asyncio.to_thread(nfo_path.exists):
         logger.debug("NFO 文件已存在且未设置覆盖，跳过: {}", nfo_path)
         return
+    if skip_if_fresh is not None and await _is_fresh(nfo_path, skip_if_fresh):
+        logger.debug("NFO 文件近期已生成，跳过: {}", nfo_path)
+        return
 
-    tvdb_payload = await tvdb.series_translations(series.tvdbId) if tvdb else None
-    tmdb_payload = await tmdb.get_tv_series_details(series.tmdbId)
+    tvdb_payload, tmdb_payload = await asyncio.gather(
+        _cached_series_translations(tvdb, series.tvdbId) if tvdb else asyncio.sleep(0),
+        tmdb.get_tv_series_details(series.tmdbId)
+    )
 
-    context = {
-        "title": getattr(tvdb_payload, 'name', None) or (tmdb_payload.name if tmdb_payload else series.title),
-        "original_title": getattr(tmdb_payload, 'original_name', None),
-        "plot": getattr(tvdb_payload, 'overview', None) or (tmdb_payload.overview if tmdb_payload else series.overview),
-        "genres": (list(tmdb_payload.genres) if tmdb_payload and tmdb_payload.genres else getattr(series, 'genres', [])),
-        "premiered": getattr(tmdb_payload, 'first_air_date', None),
-        "imdb_id": series.imdbId,
-        "tvdb_id": series.tvdbId,
-        "tmdb_id": series.tmdbId,
-    }
+    context = _build_series_context(series, tvdb_payload, tmdb_payload)
 
-    await _generate_and_save_nfo("tvshow.nfo.j2", context, nfo_path)
+    await _generate_and_save_nfo("tvshow.nfo.j2", context, nfo_path, pending_writes)
 
 async def create_episode_nfo_from_resource(
     series: SeriesResource | SonarrSeries,
     episode: EpisodeResource,
     tmdb: TmdbClient,
     tvdb: TvdbClient | None = None,
-    is_override: bool = True
+    is_override: bool = True,
+    existing_nfos: set[Path] | None = None,
+    pending_writes: PendingWrites | None = None,
+    skip_if_fresh: timedelta | None = None
 ) -> None:
-    """从 API 资源对象创建单集 NFO"""
+    """从 API 资源对象创建单集 NFO
+
+    existing_nfos 为调用方预先扫描得到的已存在 NFO 集合，提供时不再逐个检查文件；
+    skip_if_fresh 不为空时，NFO 在该时间内生成过则跳过所有网络请求
+    """
     if not episode.hasFile or not episode.episodeFile or not episode.episodeFile.path:
         return
 
     nfo_path = Path(episode.episodeFile.path).with_suffix('.nfo')
-    if await aio_os.path.exists(nfo_path) and not is_override:
+    if not is_override and (
+        nfo_path in existing_nfos if existing_nfos is not None else await asyncio.to_thread(nfo_path.exists)
+    ):
         logger.debug("NFO 文件已存在且未设置覆盖，跳过: {}", nfo_path)
         return
+    if skip_if_fresh is not None and await _is_fresh(nfo_path, skip_if_fresh):
+        logger.debug("NFO 文件近期已生成，跳过: {}", nfo_path)
+        return
 
-    context = await _get_episode_context(tmdb, tvdb, series.tmdbId, episode)
-    await _generate_and_save_nfo("episode.nfo.j2", context, nfo_path)
+    async with EPISODE_SEMAPHORE:
+        context = await _get_episode_context(tmdb, tvdb, series.tmdbId, episode)
+    await _generate_and_save_nfo("episode.nfo.j2", context, nfo_path, pending_writes)
+
+SeriesEpisodes = tuple[int, SeriesResource, list[EpisodeResource] | None]
+
+
+async def _prefetch_series_episodes(
+    sonarr_client: SonarrClient,
+    all_series: list[SeriesResource],
+    queue: asyncio.Queue[SeriesEpisodes | None]
+) -> None:
+    """生产者：提前获取各剧集的单集列表，与 NFO 生成重叠执行"""
+    for index, series in enumerate(all_series, 1):
+        if series.id is None:
+            continue
+        try:
+            episodes = await sonarr_client.get_episode_by_series_id(series.id)
+        except Exception as e:
+            logger.error("获取剧集 {} 的单集列表失败: {}", series.title, e)
+            episodes = None
+        await queue.put((index, series, episodes))
+    await queue.put(None)
 
 async def rebuild_sonarr_metadata_task(
     sonarr_client: SonarrClient,
     tmdb_client: TmdbClient | None,
-    tvdb_client: TvdbClient | None
+    tvdb_client: TvdbClient | None,
+    skip_if_fresh: timedelta | None = None
 ) -> None:
-    """遍历 Sonarr 库并重建所有 NFO"""
+    """遍历 Sonarr 库并重建所有 NFO
+
+    skip_if_fresh 默认取配置项 nfo_rebuild_skip_days（默认 0，即全部重建），
+    启用后修改时间在该范围内的 NFO 不再重新请求元数据
+    """
     if not tmdb_client:
         logger.error("TMDB 客户端未配置，无法执行 Sonarr 元数据重建任务")
         return
+    if skip_if_fresh is None and settings.nfo_rebuild_skip_days > 0:
+        skip_if_fresh = timedelta(days=settings.nfo_rebuild_skip_days)
 
     logger.info("开始重建 Sonarr ({}) 元数据...", sonarr_client.server_name)
 
@@ -207,35 +480,52 @@ async def rebuild_sonarr_metadata_task(
         total = len(all_series)
         logger.info("共获取到 {} 部剧集，开始处理...", total)
 
-        for index, series in enumerate(all_series, 1):
-            if series.id is None:
-                continue
-            logger.info("[{}/{}] 处理剧集: {}", index, total, series.title)
-
-            await create_series_nfo_from_resource(series, tmdb_client, tvdb_client)
-
-            episodes = await sonarr_client.get_episode_by_series_id(series.id)
-            if episodes:
-                for ep in episodes:
-                    if ep.hasFile and ep.episodeFile:
-                        await create_episode_nfo_from_resource(series, ep, tmdb_client, tvdb_client)
-                        await asyncio.sleep(0.2)
-
-            await asyncio.sleep(1)
+        # 单集列表由生产者提前获取，当前剧集生成 NFO 时下一部剧集的 Sonarr 请求已在进行
+        queue: asyncio.Queue[SeriesEpisodes | None] = asyncio.Queue(maxsize=SERIES_PREFETCH)
+        producer = asyncio.create_task(_prefetch_series_episodes(sonarr_client, all_series, queue))
+        try:
+            while (item := await queue.get()) is not None:
+                index, series, episodes = item
+                if index % PROGRESS_LOG_INTERVAL == 0 or index == total:
+                    logger.info("[{}/{}] 处理剧集: {}", index, total, series.title)
+                else:
+                    logger.debug("[{}/{}] 处理剧集: {}", index, total, series.title)
+
+                targets = [ep for ep in episodes or [] if ep.hasFile and ep.episodeFile]
+                # 先渲染整部剧集的 NFO，再一次性交给线程写入
+                pending_writes: PendingWrites = []
+                series_result, *results = await asyncio.gather(
+                    create_series_nfo_from_resource(
+                        series, tmdb_client, tvdb_client,
+                        pending_writes=pending_writes, skip_if_fresh=skip_if_fresh
+                    ),
+                    *(
+                        create_episode_nfo_from_resource(
+                            series, ep, tmdb_client, tvdb_client,
+                            pending_writes=pending_writes, skip_if_fresh=skip_if_fresh
+                        ) for ep in targets
+                    ),
+                    return_exceptions=True
+                )
+                if isinstance(series_result, Exception):
+                    logger.error("生成剧集 NFO 失败: {} - {}", series.title, series_result)
+                for ep, result in zip(targets, results):
+                    if isinstance(result, Exception):
+                        logger.error("生成单集 NFO 失败: {} S{}E{} - {}",
+                                     series.title, ep.seasonNumber, ep.episodeNumber, result)
+                if pending_writes:
+                    # 整部剧集写入期间只放置一次忽略文件，避免媒体服务器扫描到写了一半的目录
+                    guard = _ignore_guard(Path(series.path)) if series.path else contextlib.nullcontext()
+                    async with guard:
+                        await asyncio.to_thread(flush_nfos, pending_writes)
+        finally:
+            producer.cancel()
 
         logger.info("Sonarr ({}) 元数据重建完成。", sonarr_client.server_name)
 
     except Exception as e:
         logger.exception("重建元数据任务异常: {}", e)
 
-async def create_series_nfo(
-    payload: SonarrWebhookSeriesAddPayload,
-    tmdb: TmdbClient,
-    tvdb: TvdbClient | None = None
-) -> None:
-    """Webhook: 创建剧集 NFO"""
-    await create_series_nfo_from_resource(payload.series, tmdb, tvdb, False)
-
 async def create_episode_nfo(
     payload: SonarrWebhookDownloadPayload,
     tmdb: TmdbClient,
@@ -248,9 +538,23 @@ async def create_episode_nfo(
     episode = payload.episodes[0]
     nfo_path = Path(payload.episodeFile.path).with_suffix('.nfo')
 
-    context = await _get_episode_context(tmdb, tvdb, payload.series.tmdbId, episode)
+    async with EPISODE_SEMAPHORE:
+        context = await _get_episode_context(tmdb, tvdb, payload.series.tmdbId, episode)
     await _generate_and_save_nfo("episode.nfo.j2", context, nfo_path)
 
+async def _wait_for_episode_files(client: SonarrClient, series_id: int) -> list[EpisodeResource] | None:
+    """轮询 Sonarr，直到已有文件的集数稳定或超时"""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + EPISODE_POLL_TIMEOUT
+    last_count = -1
+    while True:
+        episodes = await client.get_episode_by_series_id(series_id)
+        count = sum(1 for ep in episodes or [] if ep.hasFile)
+        if (count > 0 and count == last_count) or loop.time() >= deadline:
+            return episodes
+        last_count = count
+        await asyncio.sleep(EPISODE_POLL_INTERVAL)
+
 async def handle_series_add_metadata(
     client: SonarrClient,
     payload: SonarrWebhookSeriesAddPayload,
@@ -258,39 +562,46 @@ async def handle_series_add_metadata(
     tvdb: TvdbClient | None = None
 ) -> None:
     """处理剧集添加事件"""
-    async with _temporary_ignore_file(Path(payload.series.path)):
-        await create_series_nfo(payload, tmdb, tvdb)
-        await asyncio.sleep(60)
-
-        logger.info("正在为新添加的剧集 {} 检查现有集数...", payload.series.title)
+    async with _ignore_guard(Path(payload.series.path)):
+        # 所有 NFO 在忽略文件存在期间写入，不经过 Webhook 写入队列
+        pending_writes: PendingWrites = []
         try:
-            episodes = await client.get_episode_by_series_id(payload.series.id)
+            await create_series_nfo_from_resource(payload.series, tmdb, tvdb, False, pending_writes=pending_writes)
+
+            logger.info("正在为新添加的剧集 {} 检查现有集数...", payload.series.title)
+            # 等待 Sonarr 导入现有文件，集数稳定后即可处理，无需固定等待
+            episodes = await _wait_for_episode_files(client, payload.series.id)
             if episodes:
-                count = 0
+                targets = []
+                season_dirs: set[Path] = set()
                 for ep in episodes:
-                    if ep.hasFile and ep.episodeFile and ep.episodeFile.path:
-                        if mapped_path := client.to_local_path(ep.episodeFile.path):
-                            ep.episodeFile.path = mapped_path
-
-                        await create_episode_nfo_from_resource(payload.series, ep, tmdb, tvdb, False)
-                        count += 1
-
-                if count > 0:
-                    logger.info("已补全剧集 {} 的 {} 个现有文件 NFO", payload.series.title, count)
+                    episode_file = ep.episodeFile
+                    if not ep.hasFile or not episode_file or not episode_file.path:
+                        continue
+                    if mapped_path := client.to_local_path(episode_file.path):
+                        episode_file.path = mapped_path
+                    targets.append(ep)
+                    season_dirs.add(Path(episode_file.path).parent)
+
+                # 每个季目录只列一次，避免逐集检查 NFO 是否存在
+                existing_nfos = await asyncio.to_thread(_list_existing_nfos, season_dirs)
+                for ep in targets:
+                    await create_episode_nfo_from_resource(
+                        payload.series, ep, tmdb, tvdb, False,
+                        existing_nfos=existing_nfos, pending_writes=pending_writes
+                    )
         except OSError as e:
             logger.error("为新剧集生成单集 NFO 失败: {}", e)
+        finally:
+            if pending_writes:
+                count = await asyncio.to_thread(flush_nfos, pending_writes)
+                if count > 0:
+                    logger.info("已补全剧集 {} 的 {} 个 NFO 文件", payload.series.title, count)
 
-async def create_movie_nfo(nfo_path: Path, tmdb_id: int, tmdb: TmdbClient | None, is_override: bool = True) -> None:
-    """处理电影添加事件"""
-    if not tmdb:
-        logger.error("TMDB 客户端未配置，无法执行电影元数据重建任务")
-        return
-    if await aio_os.path.exists(nfo_path) and not is_override:
-        logger.debug("NFO 文件已存在且未设置覆盖，跳过: {}", nfo_path)
-        return
-
+async def _movie_context(tmdb_id: int, tmdb: TmdbClient) -> dict:
+    """获取电影 NFO 上下文数据"""
     movie_info = await tmdb.get_movie_details(tmdb_id)
-    context = {
+    return {
         "title": movie_info.title if movie_info else None,
         "original_title": movie_info.original_title if movie_info else None,
         "year": movie_info.release_date.split('-')[0] if movie_info else None,
@@ -301,20 +612,53 @@ async def create_movie_nfo(nfo_path: Path, tmdb_id: int, tmdb: TmdbClient | None
         "imdb_id": movie_info.imdb_id if movie_info else None,
         "tmdb_id": tmdb_id,
     }
+
+async def create_movie_nfo(nfo_path: Path, tmdb_id: int, tmdb: TmdbClient | None, is_override: bool = True) -> None:
+    """处理电影添加事件"""
+    if not tmdb:
+        logger.error("TMDB 客户端未配置，无法执行电影元数据重建任务")
+        return
+    if not is_override and await asyncio.to_thread(nfo_path.exists):
+        logger.debug("NFO 文件已存在且未设置覆盖，跳过: {}", nfo_path)
+        return
+
+    context = await _movie_context(tmdb_id, tmdb)
     await _generate_and_save_nfo("movie.nfo.j2", context, nfo_path)
 
+async def _create_movie_folder_nfos(folder_path: Path, tmdb_id: int, tmdb: TmdbClient, is_override: bool) -> None:
+    """为电影目录中的所有视频文件生成 NFO，电影信息只获取一次"""
+    video_files, existing = await asyncio.to_thread(_scan_movie_folder, folder_path)
+    nfo_paths = []
+    for file in video_files:
+        nfo_path = file.with_suffix('.nfo')
+        if not is_override and nfo_path.name in existing:
+            logger.debug("NFO 文件已存在且未设置覆盖，跳过: {}", nfo_path)
+            continue
+        nfo_paths.append(nfo_path)
+
+    if not nfo_paths:
+        return
+
+    context = await _movie_context(tmdb_id, tmdb)
+    pending_writes: PendingWrites = []
+    await asyncio.gather(
+        *(_generate_and_save_nfo("movie.nfo.j2", context, nfo_path, pending_writes) for nfo_path in nfo_paths)
+    )
+    await asyncio.to_thread(flush_nfos, pending_writes)
+
 async def handle_movie_add_metadata(
     payload: RadarrWebhookAddedPayload,
     tmdb: TmdbClient | None
 ) -> None:
     """处理电影添加事件"""
+    if not tmdb:
+        logger.error("TMDB 客户端未配置，无法执行电影元数据重建任务")
+        return
     folder_path = Path(payload.movie.folderPath)
-    async with _temporary_ignore_file(folder_path):
+    async with _ignore_guard(folder_path):
         logger.info("正在为新添加的电影 {} 检查现有文件...", payload.movie.title)
         try:
-            for file in folder_path.iterdir():
-                if file.is_file() and file.suffix.lower() in VIDEO_EXTENSIONS:
-                    await create_movie_nfo(file.with_suffix('.nfo'), payload.movie.tmdbId, tmdb, False)
+            await _create_movie_folder_nfos(folder_path, payload.movie.tmdbId, tmdb, False)
         except Exception as e:
             logger.error("为新电影生成 NFO 失败: {}", e)
 
@@ -326,11 +670,9 @@ async def create_movie_nfo_from_resource(
     if not movie.path:
         return
     folder_path = Path(movie.path)
-    async with _temporary_ignore_file(folder_path):
+    async with _ignore_guard(folder_path):
         try:
-            for file in folder_path.iterdir():
-                if file.is_file() and file.suffix.lower() in VIDEO_EXTENSIONS:
-                    await create_movie_nfo(file.with_suffix('.nfo'), movie.tmdbId, tmdb)
+            await _create_movie_folder_nfos(folder_path, movie.tmdbId, tmdb, True)
         except OSError as e:
             logger.error("为电影生成 NFO 失败: {}", e)
 
@@ -353,15 +695,33 @@ async def rebuild_radarr_metadata_task(
         total = len(all_movies)
         logger.info("共获取到 {} 部电影，开始处理...", total)
 
-        for index, movie in enumerate(all_movies):
-            if movie.id is None:
-                continue
-            logger.info("[{}/{}] 处理电影: {}", index, total, movie.title)
-            if movie.hasFile and movie.movieFile and movie.movieFile.path:
-                if mapped_path := radarr_client.to_local_path(movie.movieFile.path):
-                    movie.movieFile.path = mapped_path
-
-                await create_movie_nfo_from_resource(movie, tmdb_client)
+        movies = [movie for movie in all_movies if movie.id is not None]
+        movie_semaphore = asyncio.Semaphore(MOVIE_CONCURRENCY)
+        done = 0
+
+        async def _movie_nfo(movie: MovieResource) -> None:
+            nonlocal done
+            async with movie_semaphore:
+                logger.debug("处理电影: {}", movie.title)
+                try:
+                    if movie.hasFile and movie.movieFile and movie.movieFile.path:
+                        if mapped_path := radarr_client.to_local_path(movie.movieFile.path):
+                            movie.movieFile.path = mapped_path
+
+                        await create_movie_nfo_from_resource(movie, tmdb_client)
+                finally:
+                    # 电影并发处理，按完成数量而非列表顺序汇报进度
+                    done += 1
+                    if done % PROGRESS_LOG_INTERVAL == 0 or done == len(movies):
+                        logger.info("[{}/{}] 电影处理进度", done, len(movies))
+
+        results = await asyncio.gather(
+            *(_movie_nfo(movie) for movie in movies),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("生成电影 NFO 失败: {}", result)
 
         logger.info("Radarr ({}) 元数据重建完成。", radarr_client.server_name)
     except Exception as e:
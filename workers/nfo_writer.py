@@ -0,0 +1,93 @@
+import asyncio
+import contextlib
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import NoReturn
+
+from loguru import logger
+
+from workers.utils import get_batch
+
+NFO_WRITE_BUFFER = 64 * 1024  # NFO 通常只有几 KB，64 KB 缓冲可保证单次 write 落盘
+NFO_WRITE_BATCH_SIZE = 64  # 单批写入的 NFO 文件上限
+NFO_WRITE_BATCH_WINDOW = 0.1  # 收到第一个写入请求后等待凑批的时间（秒）
+
+PendingWrites = list[tuple[Path, str]]
+
+# 进程 umask 只能通过设置来读取，导入时读取一次，避免写入线程中反复修改
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def write_nfo(file_path: Path, nfo_content: str) -> bool:
+    """同步写入单个 NFO 文件，内容未变化时跳过，返回是否写入
+
+    先写同目录下唯一命名的临时文件再 os.replace，媒体服务器不会读到写了一半的 NFO，
+    Webhook 与重建任务同时写入同一文件时也不会互相覆盖临时文件
+    """
+    data = nfo_content.encode('utf-8')
+    existing = True
+    try:
+        with open(file_path, 'rb') as nfo_file:
+            if nfo_file.read() == data:
+                return False
+    except FileNotFoundError:
+        existing = False
+
+    fd, tmp_name = tempfile.mkstemp(dir=file_path.parent, prefix=f'.{file_path.name}.', suffix='.tmp')
+    try:
+        with open(fd, 'wb', buffering=NFO_WRITE_BUFFER) as nfo_file:
+            nfo_file.write(data)
+        # mkstemp 创建的文件权限为 0600，媒体服务器常以其他用户运行：
+        # 覆盖时沿用原文件的权限，新文件按 umask 设置，与直接 open 创建的文件一致
+        with contextlib.suppress(OSError):
+            if existing:
+                shutil.copymode(file_path, tmp_name)
+            else:
+                os.chmod(tmp_name, 0o666 & ~_UMASK)
+        os.replace(tmp_name, file_path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_name)
+        raise
+    return True
+
+
+def flush_nfos(pending_writes: PendingWrites) -> int:
+    """在同一线程内批量写入 NFO 文件，返回实际写入的文件数
+
+    逐文件日志只在 DEBUG 级别输出，汇总由调用方负责
+    """
+    written = 0
+    for file_path, nfo_content in pending_writes:
+        try:
+            if write_nfo(file_path, nfo_content):
+                written += 1
+                logger.debug("已创建 NFO 文件: {}", file_path)
+            else:
+                logger.debug("NFO 文件内容未变化，跳过写入: {}", file_path)
+        except OSError as e:
+            logger.error("写入 NFO 文件失败 (IO错误): {} - {}", file_path, e)
+    return written
+
+
+async def nfo_write_task(write_queue: asyncio.Queue[tuple[Path, str]]) -> NoReturn:
+    """批量写入 Webhook 产生的 NFO 文件
+
+    整季导入时 Sonarr 会连续触发多个单集事件，收到第一个写入请求后在 NFO_WRITE_BATCH_WINDOW 内继续收集，
+    整批在一次线程调用中写入；同一路径在批内只写最后一次的内容
+    """
+    while True:
+        received = await get_batch(write_queue, NFO_WRITE_BATCH_SIZE, NFO_WRITE_BATCH_WINDOW)
+        batch = dict(received)
+        try:
+            written = await asyncio.to_thread(flush_nfos, list(batch.items()))
+            if written:
+                logger.info("已写入 {} 个 NFO 文件", written)
+        except Exception as e:
+            logger.error("批量写入 NFO 文件时出错：{}", e)
+        finally:
+            for _ in received:
+                write_queue.task_done()
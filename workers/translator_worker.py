@@ -1,17 +1,45 @@
+import asyncio
+import contextlib
 import re
 from datetime import datetime, timedelta
-from typing import cast
+from typing import NoReturn, TypeGuard, cast
 
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from loguru import logger
+from sqlalchemy.exc import SQLAlchemyError
 
 from clients.ai_client import AIClientWarper
 from clients.tmdb_client import TmdbClient
 from core.config import genre_mapping
+from core.database import async_session
 from models.protocols import BaseItem
 from models.tmdb import TmdbEpisode
+from repositories.translation_repo import TranslationRepository
 from services.media_service import MediaService
+from workers.context import CONTEXT
+from workers.utils import EPISODE_TITLE_RE, get_batch
 
+_CJK_RE = re.compile(r'[\u4e00-\u9fff]')
+ITEM_UPDATE_BATCH_SIZE = 32  # 单批回写的媒体项上限
+ITEM_UPDATE_BATCH_WINDOW = 0.2  # 收到第一个更新后等待凑批的时间（秒）
+TRANSLATE_FLUSH_DELAY = 5  # 首个待翻译媒体项登记后等待凑批写入数据库的时间（秒）
+TRANSLATE_SWEEP_CONCURRENCY = 4  # translate_sweep 同时翻译的媒体项上限
+TRANSLATE_SWEEP_LEASE = timedelta(hours=1)  # 领取后未处理完成的记录在此时间后重新执行
+
+ItemUpdate = tuple[int, str, BaseItem]
+
+_pending_translations: dict[tuple[int, str], datetime] = {}  # 尚未写入数据库的待翻译媒体项
+_pending_lock = asyncio.Lock()  # 串行化缓冲写入与取消
+_flush_task: asyncio.Task | None = None
+
+
+def _needs_translation(text: object) -> TypeGuard[str]:
+    """文本非空，且不含中文或带有待更新的 AI 翻译标记"""
+    return bool(text) and isinstance(text, str) and (not _CJK_RE.search(text) or '（AI翻译）' in text)
+
+def _provider_id(item: BaseItem, provider: str) -> str | None:
+    """读取外部 ID，兼容 `Tvdb` 与 `TVDB` 两种键名写法"""
+    ids = item.ProviderIds
+    return ids.get(provider) or ids.get(provider.upper())
 
 async def _get_tmdb_episode_info(
     item: BaseItem,
@@ -19,15 +47,22 @@ async def _get_tmdb_episode_info(
     media_client: MediaService
 ) -> TmdbEpisode | None:
     """Helper: 获取单集的 TMDB 信息，包含复杂的 ID 关联和回退逻辑"""
-    tvdb_id = item.ProviderIds.get('Tvdb') or item.ProviderIds.get('TVDB')
-    if tvdb_id:
-        tmdb_find = await tmdb_client.find_info_by_external_id('tvdb_id', tvdb_id)
-        if tmdb_find and tmdb_find.tv_episode_results:
-            return tmdb_find.tv_episode_results[0]
-
-    imdb_id = item.ProviderIds.get('Imdb') or item.ProviderIds.get('IMDB')
-    if imdb_id:
-        tmdb_find = await tmdb_client.find_info_by_external_id('imdb_id', imdb_id)
+    tvdb_id = _provider_id(item, 'Tvdb')
+    imdb_id = _provider_id(item, 'Imdb')
+
+    # TVDB 与 IMDB 查询互不依赖，并发请求；两者都命中时仍优先使用 TVDB 的结果
+    lookups = [
+        tmdb_client.find_info_by_external_id(source, external_id)
+        for source, external_id in (('tvdb_id', tvdb_id), ('imdb_id', imdb_id))
+        if external_id
+    ]
+    for tmdb_find in await asyncio.gather(*lookups, return_exceptions=True):
+        if isinstance(tmdb_find, BaseException):
+            # 取消等非 Exception 异常不应被吞掉
+            if not isinstance(tmdb_find, Exception):
+                raise tmdb_find
+            logger.warning("通过外部 ID 查询 TMDB 单集失败: {}", tmdb_find)
+            continue
         if tmdb_find and tmdb_find.tv_episode_results:
             return tmdb_find.tv_episode_results[0]
 
@@ -38,44 +73,32 @@ async def _get_tmdb_episode_info(
     if not series_info:
         return None
 
-    series_tmdb_id = series_info.ProviderIds.get('Tmdb') or series_info.ProviderIds.get('TMDB')
-    if not series_tmdb_id:
+    # ProviderIds 中的值均为字符串，TMDB 客户端需要整数 ID
+    series_tmdb_id = _provider_id(series_info, 'Tmdb')
+    if not series_tmdb_id or not series_tmdb_id.isdigit():
         return None
 
     season_num = item.ParentIndexNumber
     if season_num is None:
         return None
 
-    tmdb_season = await tmdb_client.get_tv_seasons_details(series_tmdb_id, season_num)
-
-    if not tmdb_season:
-        logger.warning(f"获取 TMDB S{season_num} 失败，尝试获取最新季进行匹配")
-        series_detail = await tmdb_client.get_tv_series_details(series_tmdb_id)
-        if series_detail and series_detail.seasons:
-            last_season = series_detail.seasons[-1]
-            tmdb_season = await tmdb_client.get_tv_seasons_details(series_tmdb_id, last_season.season_number)
-
-    if not tmdb_season or not tmdb_season.episodes:
-        return None
-
     # 尝试通过首播日期匹配
     premiere_date = item.PremiereDate
+    if not premiere_date:
+        return None
 
-    if premiere_date:
-        for ep in tmdb_season.episodes:
-            if ep.air_date == premiere_date.strftime('%Y-%m-%d'):
-                return ep
+    season_index = await tmdb_client.get_tv_season_air_date_index_or_latest(int(series_tmdb_id), season_num)
+    if not season_index:
+        return None
 
-    return None
+    return season_index.get(premiere_date.strftime('%Y-%m-%d'))
 
 async def translate_media_item(server_id: int, item_id: str) -> None:
     """翻译 Emby/Jellyfin 媒体项的名称、排序名称和概述字段。"""
-    from main import app
-    tmdb_client: TmdbClient | None = app.state.tmdb_client
-    media_clients: dict[int, MediaService] = app.state.media_clients
-    ai_client: AIClientWarper = app.state.ai_client
+    tmdb_client = CONTEXT.tmdb_client
+    ai_client = cast(AIClientWarper, CONTEXT.ai_client)
 
-    media_client = media_clients.get(server_id)
+    media_client = CONTEXT.media_clients.get(server_id)
     if not media_client:
         logger.error("服务器 [{}] 客户端未运行或不存在，跳过翻译任务: {}", server_id, item_id)
         return
@@ -87,6 +110,11 @@ async def translate_media_item(server_id: int, item_id: str) -> None:
 
     item = cast(BaseItem, item_info)
 
+    # 名称与简介均无需翻译时不会回写，直接返回，省去后续的 TMDB 查询
+    if not (_needs_translation(item.Name) or _needs_translation(item.Overview)):
+        logger.info("[{}]无需翻译ID: {}", server_id, item_id)
+        return
+
     # 尝试从 TMDB 获取对应的信息
     tmdb_name: str | None = None
     tmdb_overview: str | None = None
@@ -99,12 +127,12 @@ async def translate_media_item(server_id: int, item_id: str) -> None:
         if tmdb_ep:
             tmdb_overview = tmdb_ep.overview
             # 过滤无效标题
-            if tmdb_ep.name and not re.match(r'^(第[\d ]+集|Episode\s*[\d ]+)$', tmdb_ep.name, re.IGNORECASE):
+            if tmdb_ep.name and not EPISODE_TITLE_RE.match(tmdb_ep.name):
                 tmdb_name = tmdb_ep.name
 
     # 电影或剧集处理 (Movie / Series) # Radarr 能够提供足够的中文元数据，因此跳过Movie
     else:
-        imdb_id = item.ProviderIds.get('Imdb') or item.ProviderIds.get('IMDB')
+        imdb_id = _provider_id(item, 'Imdb')
         if imdb_id and tmdb_client:
             tmdb_find_res = await tmdb_client.find_info_by_external_id('imdb_id', imdb_id)
             if tmdb_find_res:
@@ -125,44 +153,51 @@ async def translate_media_item(server_id: int, item_id: str) -> None:
     }
 
     updates = {}
+    source_texts: dict[str, str] = {}  # 去掉 AI 翻译标记后的原文
+    translations: dict[str, str | None] = {}
 
     for field, text in fields_to_translate_item.items():
         # 检查文本是否为空或包含中文字符
-        if not text or not isinstance(text, str) or (re.search(r'[\u4e00-\u9fff]', text) and '（AI翻译）' not in text):
+        if not _needs_translation(text):
             updates[field] = text
             continue
 
         is_translated = True
-        translated_text = None
+        if text.endswith('（AI翻译）'):
+            text = text[:-6]
+        source_texts[field] = text
 
         # 优先使用 TMDB 数据
         if field == 'Name' and tmdb_name:
-            translated_text = tmdb_name
+            translations[field] = tmdb_name
         elif field == 'Overview' and tmdb_overview:
-            translated_text = tmdb_overview
-
-        # 如果 TMDB 没有数据，使用 AI 翻译
-        if text.endswith('（AI翻译）'):
-            text = text[:-6]
+            translations[field] = tmdb_overview
 
-        if not translated_text:
-            translated_text = await ai_client.translate(field, text)
+    # 如果 TMDB 没有数据，使用 AI 翻译；各字段互不依赖，并发请求
+    ai_fields = [field for field in source_texts if field not in translations]
+    if ai_fields:
+        results = await asyncio.gather(*(ai_client.translate(field, source_texts[field]) for field in ai_fields))
+        translations.update(zip(ai_fields, results))
 
+    for field, translated_text in translations.items():
         if translated_text:
             updates[field] = f"{translated_text}（AI翻译）"
         else:
+            text = source_texts[field]
             updates[field] = text
             logger.warning("项目 {} 中的字段 {} 翻译失败：{}", field, item_id, text)
 
     if item.Genres:
         updates['Genres'] = [genre_mapping.get(genre, genre) for genre in item.Genres]
 
-    if updates:
-        item = item.model_copy(update=updates)
+    # 就地赋值即可：BaseModel.__setattr__ 会把字段记入 fields_set，exclude_unset 回写时仍包含这些字段，
+    # 无需 model_copy 复制整棵模型
+    for field, value in updates.items():
+        setattr(item, field, value)
 
     if is_translated:
         logger.info("[{}]正在翻译项目 {}：{}", server_id, item_id, item.Name)
-        await media_client.post_item_info(item_id, item)
+        await cast(asyncio.Queue, CONTEXT.item_update_queue).put((server_id, item_id, item))
         await add_translate_media_item(server_id, item_id, days=8)
 
         logger.info("[{}]计划在 8 天后重试项目 {}", server_id, item_id)
@@ -170,38 +205,131 @@ async def translate_media_item(server_id: int, item_id: str) -> None:
         logger.info("[{}]无需翻译ID: {}", server_id, item_id)
 
 async def add_translate_media_item(server_id: int, item_id: str, days: int) -> None:
-    """添加媒体项翻译任务到调度器。
+    """计划在若干天后翻译媒体项。
+    先记入内存缓冲，TRANSLATE_FLUSH_DELAY 后整批写入数据库，由 translate_sweep 定时任务统一执行，
+    媒体库扫描时大量媒体项到达只产生一次写入，而不是逐项向调度器添加任务。
     Args:
-        scheduler (AsyncIOScheduler): 任务调度器，用于管理计划的任务。
         server_id (int): 服务器的唯一标识符。
         item_id (str): 媒体项的唯一标识符。
+        days (int): 延迟执行的天数。
     """
-    from main import app
-    scheduler: AsyncIOScheduler = app.state.scheduler
-
-    scheduler.add_job(
-        translate_media_item,
-        'date',
-        run_date=datetime.now() + timedelta(days=days),
-        id=f'translate_media_item_{server_id}_{item_id}',
-        replace_existing=True,
-        args=[server_id, item_id]
-    )
+    global _flush_task
+
+    _pending_translations[(server_id, item_id)] = datetime.now() + timedelta(days=days)
+    if _flush_task is None or _flush_task.done():
+        _flush_task = asyncio.create_task(_flush_later())
     logger.info("已为项目 {} 添加翻译任务", item_id)
 
 async def cancel_translate_media_item(server_id: int, item_id: str) -> None:
     """取消已计划的翻译任务。
     Args:
-        scheduler (AsyncIOScheduler): 任务调度器，用于管理计划的任务。
+        server_id (int): 服务器的唯一标识符。
         item_id (str): 媒体项的唯一标识符。
     """
-    from main import app
-    scheduler: AsyncIOScheduler = app.state.scheduler
-
-    job_id = f'translate_media_item_{server_id}_{item_id}'
-    job = scheduler.get_job(job_id)
-    if job:
-        scheduler.remove_job(job_id)
+    # 与 flush_pending_translations 互斥，避免先删除记录、随后又被正在进行的写入重新插入
+    async with _pending_lock:
+        buffered = _pending_translations.pop((server_id, item_id), None) is not None
+        async with async_session() as session:
+            try:
+                stored = await TranslationRepository(session).delete(server_id, item_id)
+            except SQLAlchemyError as e:
+                logger.error("取消项目 {} 的翻译任务失败：{}", item_id, e)
+                return
+    if buffered or stored:
         logger.info("已取消项目 {} 的翻译任务", item_id)
     else:
         logger.info("项目 {} 没有计划的翻译任务", item_id)
+
+async def _flush_later() -> None:
+    await asyncio.sleep(TRANSLATE_FLUSH_DELAY)
+    await flush_pending_translations()
+
+async def flush_pending_translations() -> None:
+    """将缓冲中的待翻译媒体项写入数据库"""
+    async with _pending_lock:
+        if not _pending_translations:
+            return
+        entries = dict(_pending_translations)
+        _pending_translations.clear()
+        async with async_session() as session:
+            try:
+                await TranslationRepository(session).upsert_many(entries)
+            except SQLAlchemyError as e:
+                logger.error("写入待翻译媒体项失败：{}", e)
+                # 写入失败时放回缓冲，期间新加入的记录优先
+                for key, run_at in entries.items():
+                    _pending_translations.setdefault(key, run_at)
+
+async def close_pending_translations() -> None:
+    """取消延迟写入任务，并立即写入缓冲中的待翻译媒体项（关闭时调用）"""
+    if _flush_task is not None and not _flush_task.done():
+        _flush_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _flush_task
+    await flush_pending_translations()
+
+async def translate_sweep() -> None:
+    """执行所有已到期的翻译任务
+
+    到期记录先以租约领取，逐项处理完成后才删除；进程中途退出时未处理的记录在租约到期后重新执行
+    """
+    await flush_pending_translations()
+    lease_until = datetime.now() + TRANSLATE_SWEEP_LEASE
+    async with async_session() as session:
+        due = await TranslationRepository(session).claim_due(datetime.now(), lease_until)
+    if not due:
+        return
+
+    logger.info("开始执行 {} 个到期的翻译任务", len(due))
+    semaphore = asyncio.Semaphore(TRANSLATE_SWEEP_CONCURRENCY)
+
+    async def _run(server_id: int, item_id: str) -> None:
+        async with semaphore:
+            try:
+                await translate_media_item(server_id, item_id)
+            except Exception as e:
+                # 保留记录，租约到期后重试
+                logger.error("[{}]翻译项目 {} 失败：{}", server_id, item_id, e)
+                return
+            # 需要重试时 translate_media_item 已重新登记：缓冲已写入则执行时间不再等于租约，不会被删除；
+            # 尚在缓冲中则随后的写入会重新插入记录
+            async with async_session() as session:
+                try:
+                    await TranslationRepository(session).delete_claimed(server_id, item_id, lease_until)
+                except SQLAlchemyError as e:
+                    logger.error("[{}]清理项目 {} 的翻译任务失败：{}", server_id, item_id, e)
+
+    await asyncio.gather(*(_run(server_id, item_id) for server_id, item_id in due))
+
+async def _post_item_update(media_clients: dict[int, MediaService], server_id: int, item_id: str, item: BaseItem) -> None:
+    media_client = media_clients.get(server_id)
+    if not media_client:
+        logger.error("服务器 [{}] 客户端未运行或不存在，跳过回写: {}", server_id, item_id)
+        return
+    await media_client.post_item_info(item_id, item)
+
+async def item_update_task(
+    update_queue: asyncio.Queue[ItemUpdate],
+    media_clients: dict[int, MediaService]
+) -> NoReturn:
+    """批量回写翻译后的媒体项
+
+    收到第一个更新后在 ITEM_UPDATE_BATCH_WINDOW 内继续收集，整批并发提交，
+    同一媒体项在批内只提交最后一次更新
+    """
+    while True:
+        received = await get_batch(update_queue, ITEM_UPDATE_BATCH_SIZE, ITEM_UPDATE_BATCH_WINDOW)
+        batch: dict[tuple[int, str], BaseItem] = {
+            (server_id, item_id): item for server_id, item_id, item in received
+        }
+        try:
+            results = await asyncio.gather(
+                *(_post_item_update(media_clients, sid, iid, it) for (sid, iid), it in batch.items()),
+                return_exceptions=True
+            )
+            for (sid, iid), result in zip(batch, results):
+                if isinstance(result, Exception):
+                    logger.error("[{}]回写项目 {} 失败：{}", sid, iid, result)
+        finally:
+            for _ in received:
+                update_queue.task_done()
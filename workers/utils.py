@@ -0,0 +1,26 @@
+import asyncio
+import re
+from typing import TypeVar
+
+T = TypeVar("T")
+
+EPISODE_TITLE_RE = re.compile(r'^(第[\d ]+集|Episode\s*[\d ]+)$', re.IGNORECASE)  # TMDB 占位标题
+
+
+async def get_batch(queue: asyncio.Queue[T], max_size: int, window: float) -> list[T]:
+    """等待队列中的第一项，随后在 window 秒内继续收集，最多 max_size 项
+
+    调用方处理完整批后需对每一项调用 queue.task_done()
+    """
+    loop = asyncio.get_running_loop()
+    batch = [await queue.get()]
+    deadline = loop.time() + window
+    while len(batch) < max_size:
+        timeout = deadline - loop.time()
+        if timeout <= 0:
+            break
+        try:
+            batch.append(await asyncio.wait_for(queue.get(), timeout))
+        except asyncio.TimeoutError:
+            break
+    return batch